@@ -1,32 +1,63 @@
 """Flask app for visiting card OCR and data extraction"""
 
 from flask import Flask, request, jsonify
+from flask.json.provider import JSONProvider
 
 import boto3
-import PIL
+from PIL import Image
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError
 import os
-from io import BytesIO
+import re
+import atexit
+import asyncio
 import json
+import orjson
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
-from urllib.parse import urlparse, unquote_plus
-#import pillow_heif
+from itertools import islice
+from urllib.parse import unquote_plus
 import logging
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-from extract_info import extract_information
+from extract_info import extract_information, normalize_extracted_data
 from merge_info import merge_extracted_data
-from llm_utils import get_model
-from prompt import get_prompt
+from llm_utils import MODEL_NAME, get_model, image_part
+from prompt import get_prompt, get_pair_instruction
 from info_utils import has_content
+from cache_utils import ResponseCache, make_cache_key
+from image_utils import MAX_IMAGE_EDGE, JPEG_QUALITY, decode_image, prepare_image_for_llm, is_blank_image
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson for jsonify and request.get_json."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
-# pillow_heif.register_heif_opener()
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 
+# A visiting card has at most two sides
+MAX_CARD_IMAGES = 2
+MAX_IMAGE_BYTES = 16 * 1024 * 1024  # 16MB max image size
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.webp', '.heic', '.heif')
+
+# Results are stored next to the images as <prefix>/extraction_result.json
+RESULT_DATA_TYPE = "extraction_result"
+# S3 metadata on stored results identifying the image versions they came from
+RESULT_FINGERPRINT_METADATA = "source-fingerprint"
+EMPTY_EXTRACTION_WARNING = "Warning: No visiting card information was extracted from the image(s). The uploaded image(s) may not be a visiting card."
+
 # AWS S3 Configuration
 AWS_ACCESS_KEY_ID = os.getenv('ACCESS_KEY_ID')
 AWS_SECRET_ACCESS_KEY = os.getenv('SECRET_ACCESS_KEY')
@@ -37,14 +68,63 @@ S3_CLIENT = boto3.client(
     's3',
     region_name=AWS_REGION,
     aws_access_key_id=AWS_ACCESS_KEY_ID,
-    aws_secret_access_key=AWS_SECRET_ACCESS_KEY
+    aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
+    # Module-level client so warm Lambda containers reuse its keep-alive
+    # connections; the pool is sized for concurrent downloads and uploads
+    config=Config(
+        max_pool_connections=50,
+        tcp_keepalive=True,
+        connect_timeout=2,
+        read_timeout=10,
+        retries={'mode': 'adaptive', 'max_attempts': 3}
+    )
 )
 
 if not S3_BUCKET:
     raise ValueError("S3_BUCKET_NAME environment variable is required")
 
+# Shared worker pool for the per-request S3 downloads and LLM calls, so threads
+# are not started and torn down on every request (and persist on warm Lambdas)
+IO_POOL_WORKERS = int(os.getenv('IO_POOL_WORKERS', '8'))
+EXECUTOR = ThreadPoolExecutor(max_workers=IO_POOL_WORKERS, thread_name_prefix='card-io')
+atexit.register(EXECUTOR.shutdown)
+
 
 # S3 Operations
+
+# Path style:     https://s3.us-east-1.amazonaws.com/bucket/key
+# Virtual hosted: https://bucket.s3.us-east-1.amazonaws.com/key
+S3_URL_PATTERN = re.compile(
+    r'^https?://(?:'
+    r's3[.-][^/]*amazonaws\.com[^/]*/(?P<path_bucket>[^/?#]+)/(?P<path_key>[^?#]+)'
+    r'|(?P<host_bucket>[^/]+?)\.s3[^/]*amazonaws\.com[^/]*/(?P<host_key>[^?#]+)'
+    r')',
+    re.IGNORECASE
+)
+
+
+def parse_s3_url(s3_url):
+    """
+    Extract the bucket and object key from an S3 URL.
+    
+    Args:
+        s3_url: S3 URL (Path style or Virtual-hosted style)
+    
+    Returns:
+        Tuple of (bucket name, object key)
+    
+    Raises:
+        ValueError: If the URL is not a recognized S3 URL
+    """
+    match = S3_URL_PATTERN.match(s3_url)
+    if not match:
+        raise ValueError(f"Invalid S3 URL (expected an http(s) amazonaws.com path-style or virtual-hosted URL): {s3_url}")
+    
+    bucket = match.group('path_bucket') or match.group('host_bucket')
+    key = match.group('path_key') or match.group('host_key')
+    return bucket, key
+
+
 def download_image_from_s3(s3_url):
     """
     Download image from S3 URL and return PIL Image object.
@@ -61,53 +141,26 @@ def download_image_from_s3(s3_url):
     try:
         logger.info(f"Starting image download from S3 URL: {s3_url}")
         
-        parsed = urlparse(s3_url)
-        
-        # Validations
-        if not parsed.scheme.startswith('http'):
-             raise ValueError("URL must start with http or https")
-             
-        if "amazonaws.com" not in parsed.netloc:
-             # Relax this if needed, but original code had it.
-             raise ValueError(f"Invalid S3 URL (must contain amazonaws.com): {s3_url}")
-
-        bucket = None
-        key = None
-
-        # Determine URL style
-        # Path style: https://s3.us-east-1.amazonaws.com/bucket/key
-        # Virtual hosted: https://bucket.s3.us-east-1.amazonaws.com/key
-        
-        if parsed.netloc.startswith('s3.') or parsed.netloc.startswith('s3-'):
-            # Path style
-            path_parts = parsed.path.lstrip('/').split('/', 1)
-            if len(path_parts) < 2:
-                raise ValueError(f"Invalid S3 path-style URL (cannot extract bucket/key): {s3_url}")
-            bucket = path_parts[0]
-            key = path_parts[1]
-        else:
-            # Assume Virtual-hosted style
-            # Bucket is in the hostname before .s3
-            s3_index = parsed.netloc.find('.s3')
-            if s3_index != -1:
-                bucket = parsed.netloc[:s3_index]
-                key = parsed.path.lstrip('/')
-            else:
-                # Fallback: maybe just bucket.s3.amazonaws.com without region in hostname?
-                # or just bucket.s3-region... 
-                # If we cannot find '.s3', try splitting by first dot if it looks like a bucket
-                # But safer to throw error if pattern isn't recognized
-                raise ValueError(f"Could not parse bucket from S3 URL: {s3_url}")
+        bucket, key = parse_s3_url(s3_url)
 
         logger.info(f"Parsed - Bucket: {bucket}, Key: {key}")
 
-        if not bucket or not key:
-            raise ValueError(f"Failed to identify bucket or key from URL: {s3_url}")
-
         # Get image from S3
         response = S3_CLIENT.get_object(Bucket=bucket, Key=key)
-        image_data = response['Body'].read()
-        image = PIL.Image.open(BytesIO(image_data))
+        with response['Body'] as body:
+            # Reject oversized objects from the headers, before reading the body
+            if response.get('ContentLength', 0) > MAX_IMAGE_BYTES:
+                raise ValueError(f"Image is too large ({response['ContentLength']} bytes, max {MAX_IMAGE_BYTES})")
+            image_data = body.read()
+        
+        # Decode once, eagerly and to RGB, so every later use (blank check,
+        # resize, retries) works on the same in-memory pixels
+        image = decode_image(image_data)
+        
+        # Fingerprint of the original bytes, used as the LLM response cache key
+        image.info['source_sha256'] = hashlib.sha256(image_data).hexdigest()
+        # Version of the object that was read, recorded with the stored result
+        image.info['source_etag'] = response.get('ETag')
         
         logger.info(f"Successfully downloaded image from bucket: {bucket}, key: {key}")
         return image, bucket, key
@@ -116,7 +169,7 @@ def download_image_from_s3(s3_url):
         raise ValueError(f"Failed to download image from S3: {str(e)}")
 
 
-def upload_data_to_s3(data, bucket, key_prefix, data_type="extraction"):
+def upload_data_to_s3(data, bucket, key_prefix, data_type="extraction", metadata=None):
     """
     Upload extracted data to S3 as JSON.
     
@@ -125,6 +178,7 @@ def upload_data_to_s3(data, bucket, key_prefix, data_type="extraction"):
         bucket: S3 bucket name
         key_prefix: S3 key prefix (directory)
         data_type: Type of data being uploaded (for filename)
+        metadata: Optional S3 user metadata stored with the object
     
     Returns:
         S3 key where data was uploaded
@@ -138,15 +192,16 @@ def upload_data_to_s3(data, bucket, key_prefix, data_type="extraction"):
         # We use a static filename to ensure only one result file exists per entity
         data_key = f"{key_prefix}/{data_type}.json"
         
-        # Convert data to JSON
-        json_data = json.dumps(data, indent=2)
+        # Convert data to JSON (orjson returns UTF-8 bytes directly)
+        json_data = orjson.dumps(data, option=orjson.OPT_INDENT_2)
         
         # Upload to S3
         S3_CLIENT.put_object(
             Bucket=bucket,
             Key=data_key,
-            Body=json_data.encode('utf-8'),
-            ContentType='application/json'
+            Body=json_data,
+            ContentType='application/json',
+            Metadata=metadata or {}
         )
         
         logger.info(f"Successfully uploaded data to S3: {data_key}")
@@ -156,21 +211,172 @@ def upload_data_to_s3(data, bucket, key_prefix, data_type="extraction"):
         raise ValueError(f"Failed to upload data to S3: {str(e)}")
 
 
+def get_key_prefix(key):
+    """Return the folder part of an S3 key ('' for top-level keys)."""
+    return '/'.join(key.split('/')[:-1]) if '/' in key else ''
+
+
+def get_image_source(image, bucket, key):
+    """Return the (bucket, key, ETag) of the S3 object an image was read from."""
+    return bucket, key, image.info.get('source_etag')
+
+
+def get_result_fingerprint(sources):
+    """
+    Fingerprint the inputs a stored result was extracted with.
+    
+    Covers the exact image versions and the LLM settings, so a new upload or a
+    model, prompt or preprocessing change both make the stored result stale.
+    
+    Args:
+        sources: List of (bucket, key, ETag) tuples
+    
+    Returns:
+        Fingerprint string, stored as S3 metadata on the result object
+    """
+    # Two-sided cards sent in one call also depend on the pair instruction
+    instruction = LLM_PAIR_INSTRUCTION if BATCH_CARD_SIDES and len(sources) == 2 else None
+    return make_cache_key(
+        *get_llm_settings(instruction),
+        *sorted(f"{bucket}/{key}:{etag}" for bucket, key, etag in sources)
+    )
+
+
+def load_existing_result(image_urls):
+    """
+    Load a previously stored extraction result for the given images.
+    
+    The stored result is only reused if its fingerprint metadata shows it was
+    extracted from exactly these images and none of them has changed since
+    (same ETag). A result built from the first side alone is therefore never
+    returned once the second side has been uploaded, however close together
+    the two uploads were.
+    
+    Args:
+        image_urls: List of 1-2 S3 URLs
+    
+    Returns:
+        Tuple of (stored data dict, result S3 key), or (None, None) if there
+        is no usable stored result
+    """
+    try:
+        locations = [parse_s3_url(url) for url in image_urls]
+        bucket, key = locations[0]
+        result_key = f"{get_key_prefix(key)}/{RESULT_DATA_TYPE}.json"
+        
+        response = S3_CLIENT.get_object(Bucket=bucket, Key=result_key)
+        with response['Body'] as body:
+            # Results stored before fingerprinting have no metadata and are not reused
+            stored_fingerprint = response.get('Metadata', {}).get(RESULT_FINGERPRINT_METADATA)
+            if not stored_fingerprint:
+                return None, None
+            
+            sources = [
+                (image_bucket, image_key, S3_CLIENT.head_object(Bucket=image_bucket, Key=image_key)['ETag'])
+                for image_bucket, image_key in locations
+            ]
+            if get_result_fingerprint(sources) != stored_fingerprint:
+                return None, None
+            
+            return orjson.loads(body.read()), result_key
+    
+    # The lookup is optional; any S3 or parsing failure falls through to extraction
+    except (ClientError, BotoCoreError, ValueError):
+        return None, None
+
+
 # LLM OPERATIONS
 
-def load_llm_prompt():
-    """Load the LLM model and prompt."""
-    model = get_model()
-    prompt = get_prompt()
-    return model, prompt
+# Loaded once per process (or warm Lambda container) instead of per request
+# The prompt always goes first and is byte-identical across requests, so the
+# provider's prefix cache can reuse it; per-request text goes after the images
+LLM_MODEL = get_model()
+LLM_PROMPT = get_prompt()
+LLM_PAIR_INSTRUCTION = get_pair_instruction()
+
+# Send both sides of a two-image card in one LLM call instead of two calls + merge.
+# Off by default until its accuracy has been compared with the merge path.
+BATCH_CARD_SIDES = os.getenv('BATCH_CARD_SIDES', 'false').lower() == 'true'
+
+# LLM response cache: exact matches on image bytes + prompt skip the LLM call.
+# Set LLM_CACHE_S3=true to persist entries in S3 across cold starts.
+LLM_CACHE_SIZE = int(os.getenv('LLM_CACHE_SIZE', '1024'))
+LLM_CACHE_S3 = os.getenv('LLM_CACHE_S3', 'false').lower() == 'true'
+LLM_CACHE_PREFIX = 'llm-cache'
+
+
+def load_cached_response(cache_key):
+    """Read a cached LLM response text from S3, or None if absent."""
+    try:
+        response = S3_CLIENT.get_object(Bucket=S3_BUCKET, Key=f"{LLM_CACHE_PREFIX}/{cache_key}.json")
+        return orjson.loads(response['Body'].read()).get('response_text')
+    except S3_CLIENT.exceptions.NoSuchKey:
+        return None
+    except Exception as e:
+        logger.warning(f"Failed to read LLM cache entry {cache_key}: {str(e)}")
+        return None
+
+
+def store_cached_response(cache_key, response_text):
+    """Write an LLM response text to the S3 cache; failures are only logged."""
+    try:
+        S3_CLIENT.put_object(
+            Bucket=S3_BUCKET,
+            Key=f"{LLM_CACHE_PREFIX}/{cache_key}.json",
+            Body=orjson.dumps({'response_text': response_text}),
+            ContentType='application/json'
+        )
+    except Exception as e:
+        logger.warning(f"Failed to write LLM cache entry {cache_key}: {str(e)}")
+
+
+RESPONSE_CACHE = ResponseCache(
+    maxsize=LLM_CACHE_SIZE,
+    load=load_cached_response if LLM_CACHE_S3 else None,
+    store=store_cached_response if LLM_CACHE_S3 else None
+)
+
+
+def get_llm_settings(instruction=None):
+    """
+    Return the LLM settings an extraction depends on, for use in cache keys.
+    
+    Args:
+        instruction: Optional text sent after the images
+    
+    Returns:
+        Tuple of strings: model, image preprocessing, prompt and instruction
+    """
+    return MODEL_NAME, str(MAX_IMAGE_EDGE), str(JPEG_QUALITY), LLM_PROMPT, instruction or ''
+
+
+def get_response_cache_key(images, instruction=None):
+    """
+    Build the LLM response cache key for a set of images.
+    
+    The model and image preprocessing settings are part of the key, so
+    persisted entries are not reused after either of them changes.
+    
+    Args:
+        images: List of PIL Image objects
+        instruction: Optional text sent after the images
+    
+    Returns:
+        Cache key string, or None if any image has no source fingerprint
+    """
+    digests = [image.info.get('source_sha256') for image in images]
+    if not all(digests):
+        return None
+    return make_cache_key(*get_llm_settings(instruction), *digests)
 
 
-def generate_response(images):
+def generate_response(images, instruction=None):
     """
     Call LLM API with images and prompt to get response text.
     
     Args:
         images: List of PIL Image objects
+        instruction: Optional per-request text appended after the images
     
     Returns:
         Response text from LLM
@@ -179,24 +385,148 @@ def generate_response(images):
         ValueError: If LLM call fails
     """
     try:
-        # Get model and prompt
-        model, prompt = load_llm_prompt()
-        
-        # Prepare content for model
-        content = [prompt] + images
+        # Prepare content for model; downscaled JPEGs keep the upload small
+        content = [LLM_PROMPT] + [image_part(prepare_image_for_llm(image)) for image in images]
+        if instruction:
+            content.append(instruction)
         
         # Call LLM API
-        response = model.generate_content(content)
-        response_text = response.text.strip()
-        
-        return response_text
+        response = LLM_MODEL.generate_content(content)
+        return response.text.strip()
     
     except Exception as e:
         raise ValueError(f"Failed to generate response from LLM: {str(e)}")
 
 
+def warmup_llm():
+    """
+    Send one tiny LLM request so the first real request does not pay for
+    connection setup and image-codec initialization.
+    """
+    try:
+        generate_response([Image.new('RGB', (8, 8), 'white')])
+        logger.info("LLM warmup request completed")
+    except Exception as e:
+        logger.warning(f"LLM warmup failed: {str(e)}")
+
+
+# Opt-in, since the warmup request is billed like any other LLM call
+if os.getenv('LLM_WARMUP', 'false').lower() == 'true':
+    warmup_llm()
+
+
+def extract_from_images(images, instruction=None, force=False):
+    """
+    Run the LLM on one or more images and parse its response.
+    
+    Exact repeats are answered from RESPONSE_CACHE. A response is only cached
+    once it has parsed, so a one-off malformed reply is retried next time.
+    
+    Args:
+        images: List of PIL Image objects
+        instruction: Optional per-request text appended after the images
+        force: Skip the cache lookup and always call the LLM
+    
+    Returns:
+        Normalized extracted data dict
+    """
+    cache_key = get_response_cache_key(images, instruction)
+    if cache_key and not force:
+        cached_text = RESPONSE_CACHE.get(cache_key)
+        if cached_text is not None:
+            logger.info(f"LLM response cache hit: {cache_key}")
+            return extract_information(cached_text)
+    
+    response_text = generate_response(images, instruction)
+    extracted_data = extract_information(response_text)
+    
+    if cache_key and response_text:
+        RESPONSE_CACHE.put(cache_key, response_text)
+    
+    return extracted_data
+
+
+def extract_from_image(image, force=False):
+    """
+    Run the LLM on a single image and parse its response.
+    
+    Args:
+        image: PIL Image object
+        force: Skip the LLM response cache
+    
+    Returns:
+        Normalized extracted data dict
+    """
+    return extract_from_images([image], force=force)
+
+
+@contextmanager
+def card_images(image_urls, force=False):
+    """
+    Download images from S3 and keep the ones that can be visiting cards.
+    
+    Several URLs are downloaded concurrently. All images are closed on exit,
+    so the decoded pixels are freed as soon as the LLM call returns rather
+    than staying alive until the whole request finishes.
+    
+    Args:
+        image_urls: List of S3 URLs
+        force: Skip the blank-image check
+    
+    Yields:
+        Tuple of (list of non-blank PIL Images, list of (bucket, key, ETag) sources)
+    """
+    if len(image_urls) == 1:
+        results = [download_image_from_s3(image_urls[0])]
+    else:
+        results = list(EXECUTOR.map(download_image_from_s3, image_urls))
+    
+    try:
+        sources = [get_image_source(image, bucket, key) for image, bucket, key in results]
+        
+        # Blank or tiny images cannot be visiting cards, so they skip the LLM
+        images = [image for image, bucket, key in results if force or not is_blank_image(image)]
+        if len(images) < len(results):
+            logger.info(f"Skipping {len(results) - len(images)} blank image(s): {image_urls}")
+        
+        yield images, sources
+    finally:
+        for image, bucket, key in results:
+            image.close()
+
+
+def extract_from_url(image_url, force=False):
+    """
+    Download a single image from S3 and extract its information.
+    
+    Args:
+        image_url: S3 URL of the image
+        force: Skip the blank-image check and the LLM response cache
+    
+    Returns:
+        Tuple of (extracted data dict or None for a blank image, (bucket, key, ETag) of the image)
+    """
+    with card_images([image_url], force) as (images, sources):
+        extracted_data = extract_from_image(images[0], force) if images else None
+        return extracted_data, sources[0]
+
+
 # DATA VALIDATION
 
+# Fields that indicate a visiting card
+CARD_FIELDS = (
+    'company_name',
+    'person_name',
+    'contact_numbers',
+    'email_addresses',
+    'address',
+    'website',
+    'services',
+    'category',
+    'social_media_profiles'
+)
+
+
 def is_empty_extraction(extracted_data):
     """
     Check if extracted data contains no meaningful visiting card information.
@@ -207,81 +537,62 @@ def is_empty_extraction(extracted_data):
     Returns:
         True if no content found, False otherwise
     """
-    # Key fields that indicate a visiting card
-    key_fields = [
-        'company_name',
-        'person_name',
-        'contact_numbers',
-        'email_addresses',
-        'address',
-        'website',
-        'services',
-        'category'
-    ]
-    
-    # Check if any key field has content
-    for field in key_fields:
-        if has_content(extracted_data.get(field)):
-            return False
-    
-    # Check social media profiles
-    social_media = extracted_data.get('social_media_profiles', {})
-    if has_content(social_media):
-        return False
-    
-    # If all fields are empty, it's not a visiting card
-    return True
+    # Stops at the first field with content, which is the common case;
+    # if all fields are empty, it's not a visiting card
+    return not any(has_content(extracted_data.get(field)) for field in CARD_FIELDS)
 
 
 # IMAGE PROCESSING
 
-def process_images(image_urls):
+def process_images(image_urls, force=False):
     """
     Process one or two images from S3 URLs to extract and merge information.
     
     Args:
         image_urls: List of 1-2 S3 URLs
+        force: Skip the blank-image check and the LLM response cache
     
     Returns:
-        Tuple of (extracted data dict, S3 bucket, S3 key)
+        Tuple of (extracted data dict, S3 bucket, S3 key, list of (bucket, key, ETag) sources)
     
     Raises:
         ValueError: If processing fails
     """
     try:
-        images = []
-        s3_buckets = []
-        s3_keys = []
-        
-        # Download images from S3
-        for url in image_urls:
-            image, bucket, key = download_image_from_s3(url)
-            images.append(image)
-            s3_buckets.append(bucket)
-            s3_keys.append(key)
-        
-        if len(images) == 2:
-            # Extract information from both images separately
-            response_text1 = generate_response([images[0]])
-            response_text2 = generate_response([images[1]])
-            
-            data_image1 = extract_information(response_text1)
-            data_image2 = extract_information(response_text2)
-            
-            # Merge information from both images
-            merged_data = merge_extracted_data(data_image1, data_image2)
-            
-            return merged_data, s3_buckets[0], s3_keys[0]
+        if len(image_urls) not in (1, 2):
+            raise ValueError("Invalid number of images. Expected 1 or 2 images.")
         
-        elif len(images) == 1:
-            # Extract information from single image
-            response_text = generate_response(images)
-            extracted_data = extract_information(response_text)
-            
-            return extracted_data, s3_buckets[0], s3_keys[0]
+        if len(image_urls) == 2 and BATCH_CARD_SIDES:
+            # Both sides must be downloaded before the single LLM call
+            with card_images(image_urls, force) as (images, sources):
+                if len(images) == 2:
+                    # One LLM call sees both sides and returns already-merged data
+                    extracted_data = extract_from_images(images, LLM_PAIR_INSTRUCTION, force)
+                elif images:
+                    extracted_data = extract_from_image(images[0], force)
+                else:
+                    extracted_data = normalize_extracted_data({})
         
         else:
-            raise ValueError("Invalid number of images. Expected 1 or 2 images.")
+            # Each image is downloaded and sent to the LLM on its own worker, so
+            # one side's LLM call starts while the other side is still downloading
+            futures = [EXECUTOR.submit(extract_from_url, url, force) for url in image_urls]
+            # Collect in submission order so image1/image2 stay deterministic
+            results = [future.result() for future in futures]
+            sources = [source for data, source in results]
+            
+            card_data = [data for data, source in results if data is not None]
+            if len(card_data) == 2:
+                # Merge information from both images
+                extracted_data = merge_extracted_data(card_data[0], card_data[1])
+            elif card_data:
+                extracted_data = card_data[0]
+            else:
+                extracted_data = normalize_extracted_data({})
+        
+        # Results are stored next to the first image
+        bucket, key, _ = sources[0]
+        return extracted_data, bucket, key, sources
     
     except Exception as e:
         raise ValueError(f"Failed to process images: {str(e)}")
@@ -304,6 +615,7 @@ def process_extraction_request(data):
         
         image_urls = data.get('image_urls')
         upload_results = data.get('upload_results', True)
+        force = data.get('force', False)
 
         logger.info(f"Received info extraction request for images: {image_urls}")
         
@@ -314,14 +626,29 @@ def process_extraction_request(data):
         if not isinstance(image_urls, list):
             return {'error': 'image_urls must be an array'}, 400
         
-        if len(image_urls) > 2:
-            return {'error': 'Maximum 2 images are supported'}, 400
+        if len(image_urls) > MAX_CARD_IMAGES:
+            return {'error': f'Maximum {MAX_CARD_IMAGES} images are supported'}, 400
         
         if len(image_urls) == 0:
             return {'error': 'At least 1 image URL is required'}, 400
         
+        # Reuse the stored result for these images unless a re-run is forced
+        if not force:
+            stored_data, stored_key = load_existing_result(image_urls)
+            if stored_data is not None:
+                logger.info(f"Returning stored extraction result: {stored_key}")
+                response = {
+                    'success': True,
+                    'data': stored_data,
+                    's3_result_key': stored_key,
+                    'cache': 'hit'
+                }
+                if is_empty_extraction(stored_data):
+                    response['warning'] = EMPTY_EXTRACTION_WARNING
+                return response, 200
+        
         # Process images
-        extracted_data, bucket, key = process_images(image_urls)
+        extracted_data, bucket, key, sources = process_images(image_urls, force)
 
         # Extract event_id and info_id from the key if possible and add to extracted data
         # Expected key format: eventid/infoid/filename.ext or similar structure where IDs are in the path
@@ -336,15 +663,18 @@ def process_extraction_request(data):
         # Check if no information was extracted
         warning_message = None
         if is_empty_extraction(extracted_data):
-            warning_message = "Warning: No visiting card information was extracted from the image(s). The uploaded image(s) may not be a visiting card."
+            warning_message = EMPTY_EXTRACTION_WARNING
         
         # Upload results to S3 if requested
         result_key = None
         if upload_results:
             try:
                 # Get the directory from the image key
-                key_prefix = '/'.join(key.split('/')[:-1]) if '/' in key else ''
-                result_key = upload_data_to_s3(extracted_data, bucket, key_prefix, "extraction_result")
+                key_prefix = get_key_prefix(key)
+                result_key = upload_data_to_s3(
+                    extracted_data, bucket, key_prefix, RESULT_DATA_TYPE,
+                    metadata={RESULT_FINGERPRINT_METADATA: get_result_fingerprint(sources)}
+                )
             except Exception as e:
                 warning_message = f"{warning_message or 'Extraction successful.'} However, failed to upload results to S3: {str(e)}"
         
@@ -375,7 +705,8 @@ def extract_info():
     Request body:
     {
         "image_urls": ["https://s3.amazonaws.com/bucket/eventid/infoid/image.jpg"],
-        "upload_results": true  # Optional: whether to upload results to S3
+        "upload_results": true,  # Optional: whether to upload results to S3
+        "force": false  # Optional: re-extract, ignoring stored results and cached LLM responses
     }
     """
     data = request.get_json()
@@ -409,8 +740,7 @@ def get_info(extraction_id):
         # Download the extraction result from S3
         try:
             response = S3_CLIENT.get_object(Bucket=bucket, Key=extraction_id)
-            json_data = response['Body'].read().decode('utf-8')
-            extracted_data = json.loads(json_data)
+            extracted_data = orjson.loads(response['Body'].read())
             
             return jsonify({
                 'success': True,
@@ -432,17 +762,93 @@ def health_check():
     try:
         # Verify S3 connection
         S3_CLIENT.head_bucket(Bucket=S3_BUCKET)
-        return jsonify({'status': 'healthy', 'bucket': S3_BUCKET}), 200
+        return jsonify({
+            'status': 'healthy',
+            'bucket': S3_BUCKET,
+            'llm_cache': RESPONSE_CACHE.stats()
+        }), 200
     
     except Exception as e:
         return jsonify({'status': 'unhealthy', 'error': str(e)}), 500
 
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    # Development server only; in production run `gunicorn app:app` (see gunicorn.conf.py)
+    app.run(debug=os.getenv('FLASK_DEBUG') == '1', host='0.0.0.0', port=5000)
 
 
 
+def build_s3_event_request(bucket_name, prefix, trigger_key, region):
+    """
+    Build an extraction request for the folder an S3 event points at.
+    
+    Args:
+        bucket_name: S3 bucket name from the event record
+        prefix: Folder prefix of the triggering object (ending in '/', or '')
+        trigger_key: Unquoted key of the object that fired the event
+        region: AWS region of the bucket
+    
+    Returns:
+        Request data dict for process_extraction_request
+    """
+    logger.info(f"Checking for sibling images in bucket: {bucket_name}, prefix: {prefix}")
+    
+    # List objects in the same directory (prefix), page by page, and stop as
+    # soon as a card's worth of images has been found
+    try:
+        paginator = S3_CLIENT.get_paginator('list_objects_v2')
+        pages = paginator.paginate(Bucket=bucket_name, Prefix=prefix)
+        
+        # Lazily filter for valid image extensions; islice stops the listing
+        # (and URL building) after the first MAX_CARD_IMAGES matches
+        image_keys = (
+            obj['Key']
+            for page in pages
+            for obj in page.get('Contents', [])
+            if obj['Key'].lower().endswith(IMAGE_EXTENSIONS)
+        )
+        found_images = [
+            f"https://{bucket_name}.s3.{region}.amazonaws.com/{obj_key}"
+            for obj_key in islice(image_keys, MAX_CARD_IMAGES)
+        ]
+        
+        logger.info(f"Found {len(found_images)} images in prefix: {found_images}")
+        
+        if not found_images:
+            # Fallback if listing failed to find anything (unlikely if trigger fired)
+            s3_url = f"https://{bucket_name}.s3.{region}.amazonaws.com/{trigger_key}"
+            found_images = [s3_url]
+    
+    except Exception as e:
+        logger.error(f"Failed to list sibling files: {e}")
+        # Fallback to just processing the triggering file
+        found_images = [f"https://{bucket_name}.s3.{region}.amazonaws.com/{trigger_key}"]
+    
+    return {
+        'image_urls': found_images,
+        'upload_results': True
+    }
+
+
+async def process_extraction_requests_async(requests_data):
+    """
+    Run several extraction requests concurrently.
+    
+    The S3 and LLM calls are blocking, so each request runs in a worker
+    thread and the waits overlap.
+    
+    Args:
+        requests_data: List of request data dicts
+    
+    Returns:
+        List of response dicts, in the same order as requests_data
+    """
+    results = await asyncio.gather(
+        *[asyncio.to_thread(process_extraction_request, data) for data in requests_data]
+    )
+    return [response for response, status_code in results]
+
+
 def lambda_handler(event, context):
     """
     AWS Lambda handler function.
@@ -456,12 +862,14 @@ def lambda_handler(event, context):
         try:
             logger.info("Processing S3 Event")
             
-            # We will process based on the first record's location
-            # If multiple records come in one event, we assume they are related or we pick common prefix
-            # For simplicity, we handle the first one and look for siblings
+            # Objects in the same folder belong to the same card, so records are
+            # grouped by (bucket, prefix) and each folder is extracted once
+            requests_by_prefix = {}
             
-            record = event['Records'][0]
-            if 's3' in record:
+            for record in event['Records']:
+                if 's3' not in record:
+                    continue
+                
                 s3_info = record['s3']
                 bucket_name = s3_info['bucket']['name']
                 # S3 keys are URL-encoded in events, needs unquoting
@@ -475,48 +883,23 @@ def lambda_handler(event, context):
                 else:
                     prefix = ''
                 
-                logger.info(f"Checking for sibling images in bucket: {bucket_name}, prefix: {prefix}")
-                
-                # List objects in the same directory (prefix)
-                try:
-                    list_response = S3_CLIENT.list_objects_v2(Bucket=bucket_name, Prefix=prefix)
-                    
-                    found_images = []
-                    
-                    if 'Contents' in list_response:
-                        for obj in list_response['Contents']:
-                            obj_key = obj['Key']
-                            # Filter for valid image extensions
-                            lower_key = obj_key.lower()
-                            if lower_key.endswith(('.png', '.jpg', '.jpeg', '.webp', '.heic', '.heif')):
-                                # Construct S3 URL
-                                img_url = f"https://{bucket_name}.s3.{region}.amazonaws.com/{obj_key}"
-                                found_images.append(img_url)
-                    
-                    logger.info(f"Found {len(found_images)} images in prefix: {found_images}")
-                    
-                    if not found_images:
-                        # Fallback if listing failed to find anything (unlikely if trigger fired)
-                         s3_url = f"https://{bucket_name}.s3.{region}.amazonaws.com/{trigger_key}"
-                         found_images = [s3_url]
-                         
-                    data = {
-                        'image_urls': found_images,
-                        'upload_results': True
-                    }
-                    
-                except Exception as e:
-                    logger.error(f"Failed to list sibling files: {e}")
-                    # Fallback to just processing the triggering file
-                    s3_url = f"https://{bucket_name}.s3.{region}.amazonaws.com/{trigger_key}"
-                    data = {
-                        'image_urls': [s3_url],
-                        'upload_results': True
-                    }
+                if (bucket_name, prefix) not in requests_by_prefix:
+                    requests_by_prefix[(bucket_name, prefix)] = build_s3_event_request(
+                        bucket_name, prefix, trigger_key, region
+                    )
 
         except Exception as e:
             logger.error(f"Failed to parse S3 event record: {e}")
             return {'statusCode': 400, 'body': json.dumps({'error': f"Invalid S3 event: {str(e)}"}) }
+        
+        requests_data = list(requests_by_prefix.values())
+        
+        if len(requests_data) > 1:
+            logger.info(f"Processing {len(requests_data)} folders concurrently")
+            return asyncio.run(process_extraction_requests_async(requests_data))
+        
+        if requests_data:
+            data = requests_data[0]
 
     # Handle API Gateway (Proxy or Direct)
     elif 'body' in event:
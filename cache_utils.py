@@ -0,0 +1,83 @@
+from collections import OrderedDict
+import hashlib
+import threading
+
+
+def make_cache_key(*parts):
+    """
+    Build a stable cache key from string parts.
+
+    Args:
+        *parts: Strings that together identify a cached value
+
+    Returns:
+        SHA-256 hex digest of the parts
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode('utf-8'))
+        # Separator so ('ab', 'c') and ('a', 'bc') hash differently
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache for LLM response texts.
+
+    An optional second tier (e.g. S3) can be plugged in with the load/store
+    callables; it is consulted on a memory miss and written on every put.
+    """
+
+    def __init__(self, maxsize=1024, load=None, store=None):
+        self.maxsize = maxsize
+        self.load = load
+        self.store = store
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the cached value for key, or None on a miss."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+
+        value = self.load(key) if self.load else None
+
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._remember(key, value)
+            return value
+
+    def put(self, key, value):
+        """Cache value under key in memory and in the second tier, if any."""
+        with self._lock:
+            self._remember(key, value)
+
+        if self.store:
+            self.store(key, value)
+
+    def stats(self):
+        """Return hit/miss counters for monitoring."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else None
+            }
+
+    def _remember(self, key, value):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
@@ -1,7 +1,46 @@
 import json
+import re
 import sys
+import orjson
 from info_utils import normalize_field, normalize_social_media
 
+# Markdown code fence around the model output, with or without a json tag
+FENCE_PATTERN = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+
+# Fields normalized to arrays
+LIST_FIELDS = (
+    'company_name', 'person_name', 'contact_numbers',
+    'email_addresses', 'services', 'website', 'address'
+)
+
+def normalize_extracted_data(extracted_data):
+    """
+    Normalize parsed extraction data to the response format.
+    
+    Args:
+        extracted_data: Parsed data dict (an empty dict yields all-null fields)
+    
+    Returns:
+        Normalized extracted data dict
+    """
+    for field in LIST_FIELDS:
+        extracted_data[field] = normalize_field(
+            extracted_data.get(field),
+            return_type='list'
+        )
+    
+    # Normalize category to single string
+    extracted_data['category'] = normalize_field(
+        extracted_data.get('category'),
+        return_type='string'
+    )
+    
+    # Normalize social media profiles
+    social_media = extracted_data.get('social_media_profiles')
+    extracted_data['social_media_profiles'] = normalize_social_media(social_media)
+    
+    return extracted_data
+
 def extract_information(response_text):
     """
     Extract and normalize information from LLM response.
@@ -15,38 +54,22 @@ def extract_information(response_text):
     Raises:
         json.JSONDecodeError: If response contains invalid JSON
     """
-    # Clean the response to extract JSON
-    if "```json" in response_text:
-        response_text = response_text.split("```json")[1].split("```")[0].strip()
-    elif "```" in response_text:
-        response_text = response_text.split("```")[1].split("```")[0].strip()
+    # Clean the response to extract JSON: the object spans the first '{' to the
+    # last '}', with or without a markdown fence around it
+    start = response_text.find('{')
+    end = response_text.rfind('}')
+    
+    if start != -1 and end > start:
+        response_text = response_text[start:end + 1]
+    else:
+        fence = FENCE_PATTERN.search(response_text)
+        if fence:
+            response_text = fence.group(1).strip()
     
     try:
-        extracted_data = json.loads(response_text)
-        
-        # List fields to normalize to arrays
-        list_fields = [
-            'company_name', 'person_name', 'contact_numbers',
-            'email_addresses', 'services', 'website', 'address'
-        ]
-        
-        for field in list_fields:
-            extracted_data[field] = normalize_field(
-                extracted_data.get(field),
-                return_type='list'
-            )
-        
-        # Normalize category to single string
-        extracted_data['category'] = normalize_field(
-            extracted_data.get('category'),
-            return_type='string'
-        )
-        
-        # Normalize social media profiles
-        social_media = extracted_data.get('social_media_profiles')
-        extracted_data['social_media_profiles'] = normalize_social_media(social_media)
-        
-        return extracted_data
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        extracted_data = orjson.loads(response_text)
+        return normalize_extracted_data(extracted_data)
     
     except json.JSONDecodeError as e:
         print(f"Error: Failed to parse JSON response: {e}", file=sys.stderr)
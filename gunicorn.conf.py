@@ -0,0 +1,17 @@
+"""Gunicorn settings for serving the Flask app: gunicorn app:app"""
+
+import os
+
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:5000')
+
+# Threaded workers let one process overlap many requests that are waiting on S3 or the LLM
+worker_class = 'gthread'
+workers = int(os.getenv('GUNICORN_WORKERS', '2'))
+threads = int(os.getenv('GUNICORN_THREADS', '16'))
+
+# A two-image extraction can take longer than gunicorn's default 30s
+timeout = 120
+
+# Each request runs up to two image jobs on the app's shared thread pool, so
+# size it to match the request threads (read by app.py in each worker)
+os.environ.setdefault('IO_POOL_WORKERS', str(threads * 2))
@@ -0,0 +1,118 @@
+from io import BytesIO
+import os
+
+from PIL import Image, ImageStat
+
+try:
+    import pillow_heif
+except ImportError:  # HEIC/HEIF support is optional
+    pillow_heif = None
+else:
+    # libheif decodes with 4 threads by default; use every available core
+    pillow_heif.options.DECODE_THREADS = os.cpu_count() or 4
+    pillow_heif.register_heif_opener()
+
+# Longest edge sent to the LLM; card text stays legible well below camera resolution.
+# Fewer pixels mean fewer vision tokens, so lowering it cuts prefill cost and latency.
+MAX_IMAGE_EDGE = int(os.getenv('LLM_IMAGE_MAX_EDGE', '1600'))
+JPEG_QUALITY = 85
+
+# Images below this size cannot hold a readable card and skip the LLM
+MIN_IMAGE_PIXELS = 200 * 200
+# Optional uniformity check: skip images whose brightness stddev falls below this.
+# Off (0) by default, since sparse or light-grey text on white scores close to blank.
+MIN_PIXEL_STDDEV = float(os.getenv('BLANK_IMAGE_MIN_STDDEV', '0'))
+BLANK_CHECK_SIZE = (128, 128)
+
+
+def flatten_to_rgb(image):
+    """
+    Convert an image to RGB, compositing any transparency onto white.
+    
+    A plain convert('RGB') drops the alpha channel, which turns transparent
+    backgrounds black and hides dark card text.
+    
+    Args:
+        image: PIL Image object (left unmodified)
+    
+    Returns:
+        New PIL Image in RGB mode
+    """
+    if image.mode in ('RGBA', 'LA', 'PA') or (image.mode == 'P' and 'transparency' in image.info):
+        rgba = image.convert('RGBA')
+        flattened = Image.new('RGB', rgba.size, 'white')
+        flattened.paste(rgba, mask=rgba.getchannel('A'))
+        return flattened
+    
+    return image.convert('RGB')
+
+
+def decode_image(image_data, max_edge=MAX_IMAGE_EDGE):
+    """
+    Decode image bytes into an RGB PIL image, fully loaded in memory.
+    
+    JPEGs are decoded straight at a reduced scale whose long edge is still at
+    least max_edge, so large phone photos (e.g. 4032x3024) skip most of the
+    full-resolution decode work.
+    Transparent images are flattened onto a white background.
+    
+    Args:
+        image_data: Encoded image bytes
+        max_edge: Longest edge the image will later be downscaled to
+    
+    Returns:
+        Decoded PIL Image in RGB mode
+    """
+    with BytesIO(image_data) as buffer:
+        image = Image.open(buffer)
+        # draft() picks its scale from the shorter edge, so request a box with
+        # the image's aspect ratio whose long edge is max_edge
+        scale = max_edge / max(image.size)
+        if scale < 1:
+            image.draft('RGB', (max(1, int(image.width * scale)), max(1, int(image.height * scale))))
+        image.load()
+    
+    return image if image.mode == 'RGB' else flatten_to_rgb(image)
+
+
+def prepare_image_for_llm(image, max_edge=MAX_IMAGE_EDGE, quality=JPEG_QUALITY):
+    """
+    Downscale an image and re-encode it as JPEG for an LLM request.
+    
+    Args:
+        image: PIL Image object (left unmodified)
+        max_edge: Maximum width/height in pixels
+        quality: JPEG quality (1-95)
+    
+    Returns:
+        JPEG-encoded image bytes
+    """
+    # flatten_to_rgb() returns a copy, so the thumbnail below never touches the original
+    prepared = flatten_to_rgb(image)
+    prepared.thumbnail((max_edge, max_edge), Image.Resampling.LANCZOS)
+    
+    with BytesIO() as buffer:
+        prepared.save(buffer, format='JPEG', quality=quality, optimize=True)
+        return buffer.getvalue()
+
+
+def is_blank_image(image):
+    """
+    Check if an image is too small or too uniform to be a visiting card.
+    
+    Args:
+        image: PIL Image object
+    
+    Returns:
+        True if the image is tiny or, when MIN_PIXEL_STDDEV is set,
+        (nearly) a single solid color
+    """
+    if image.width * image.height < MIN_IMAGE_PIXELS:
+        return True
+    
+    if not MIN_PIXEL_STDDEV:
+        return False
+    
+    # Brightness spread on a small grayscale copy is enough to spot blank images
+    sample = image.resize(BLANK_CHECK_SIZE).convert('L')
+    return ImageStat.Stat(sample).stddev[0] < MIN_PIXEL_STDDEV
@@ -1,3 +1,63 @@
+from itertools import chain
+
+
+# Social media platforms with a dedicated field; anything else goes in 'other'
+SOCIAL_PLATFORMS = ('facebook', 'instagram', 'linkedin', 'twitter', 'youtube')
+
+# Template for a card without social media profiles (always return a copy)
+EMPTY_SOCIAL_MEDIA = dict.fromkeys(SOCIAL_PLATFORMS + ('other',))
+
+
+def _normalize_list(value):
+    """Normalize a value to a list of stripped strings, or None if empty."""
+    if not value:
+        return None
+    
+    # Strings are the common case from the LLM, so test them first
+    if isinstance(value, str):
+        stripped = value.strip()
+        return [stripped] if stripped else None
+    elif isinstance(value, list):
+        normalized = [str(item).strip() for item in value if item]
+        return normalized if normalized else None
+    
+    return None
+
+
+def _normalize_string(value):
+    """Normalize a value to a single stripped string, or None if empty."""
+    if not value:
+        return None
+    
+    # If it's a list, take the first non-empty item
+    if isinstance(value, list):
+        for item in value:
+            if item:
+                value = item
+                break
+        else:
+            return None
+    
+    # Convert to string and strip
+    if isinstance(value, str):
+        stripped = value.strip()
+        return stripped if stripped else None
+    
+    return None
+
+
+def _normalize_dict(value):
+    """Return a dict as-is, or None if empty."""
+    return value if value else None
+
+
+_NORMALIZERS = {
+    'list': _normalize_list,
+    'string': _normalize_string,
+    'dict': _normalize_dict
+}
+
+
 def normalize_field(value, return_type='list'):
     """
     Normalize field values to consistent format.
@@ -9,43 +69,8 @@ def normalize_field(value, return_type='list'):
     Returns:
         Normalized value or None if empty
     """
-    if return_type == 'list':
-        if not value:
-            return None
-        
-        if isinstance(value, list):
-            normalized = [str(item).strip() for item in value if item]
-            return normalized if normalized else None
-        elif isinstance(value, str):
-            stripped = value.strip()
-            return [stripped] if stripped else None
-        
-        return None
-    
-    elif return_type == 'string':
-        if not value:
-            return None
-        
-        # If it's a list, take the first non-empty item
-        if isinstance(value, list):
-            for item in value:
-                if item:
-                    value = item
-                    break
-            else:
-                return None
-        
-        # Convert to string and strip
-        if isinstance(value, str):
-            stripped = value.strip()
-            return stripped if stripped else None
-        
-        return None
-    
-    elif return_type == 'dict':
-        return value if value else None
-    
-    return None
+    normalizer = _NORMALIZERS.get(return_type)
+    return normalizer(value) if normalizer else None
 
 
 def deduplicate_list(items):
@@ -53,7 +78,7 @@ def deduplicate_list(items):
     Remove duplicates from a list while preserving order (case-insensitive comparison).
     
     Args:
-        items: List of items to deduplicate
+        items: List (or any iterable) of items to deduplicate
     
     Returns:
         Deduplicated list or None if empty
@@ -61,17 +86,20 @@ def deduplicate_list(items):
     if not items:
         return None
     
-    seen = set()
-    result = []
+    # Dicts keep insertion order, so one dict keyed by the normalized value
+    # replaces the seen-set + result-list pair and keeps the first occurrence
+    unique = {}
     
     for item in items:
-        if item:
-            item_lower = str(item).lower().strip()
-            if item_lower and item_lower not in seen:
-                seen.add(item_lower)
-                result.append(item)
-    
-    return result if result else None
+        if not item:
+            continue
+        # casefold() also matches Unicode case variants (e.g. 'ß' / 'SS')
+        key = item.casefold().strip() if type(item) is str else str(item).casefold().strip()
+        # Whitespace-only items normalize to '' and are dropped
+        if key and key not in unique:
+            unique[key] = item
+    
+    return list(unique.values()) or None
 
 
 def merge_lists(*lists, deduplicate=True):
@@ -85,22 +113,17 @@ def merge_lists(*lists, deduplicate=True):
     Returns:
         Merged list or None if empty
     """
-    combined = []
-    
-    for lst in lists:
-        if lst:
-            if isinstance(lst, list):
-                combined.extend(lst)
-            else:
-                combined.append(lst)
-    
-    if not combined:
-        return None
-    
+    # Stream the inputs into deduplication without building a combined list first
+    items = chain.from_iterable(
+        lst if isinstance(lst, list) else (lst,)
+        for lst in lists
+        if lst
+    )
+
     if deduplicate:
-        return deduplicate_list(combined)
-    
-    return combined if combined else None
+        return deduplicate_list(items)
+
+    return list(items) or None
 
 
 def normalize_social_media(social_data):
@@ -114,19 +137,11 @@ def normalize_social_media(social_data):
         Normalized social media dict
     """
     if not social_data:
-        return {
-            'facebook': None,
-            'instagram': None,
-            'linkedin': None,
-            'twitter': None,
-            'youtube': None,
-            'other': None
-        }
-    
-    platforms = ['facebook', 'instagram', 'linkedin', 'twitter', 'youtube']
+        return EMPTY_SOCIAL_MEDIA.copy()
+    
     normalized = {}
     
-    for platform in platforms:
+    for platform in SOCIAL_PLATFORMS:
         normalized[platform] = normalize_field(social_data.get(platform), return_type='list')
     
     # Handle 'other' field
@@ -135,31 +150,26 @@ def normalize_social_media(social_data):
     return normalized
 
 
-def merge_social_media(social1, social2):
+def merge_social_media(*socials):
     """
-    Merge two social media profile objects.
+    Merge social media profile objects.
     
     Args:
-        social1: First social media dict
-        social2: Second social media dict
+        *socials: Social media dicts, in priority order (None is allowed)
     
     Returns:
         Merged social media dict
     """
-    social1 = social1 or {}
-    social2 = social2 or {}
+    socials = [social or {} for social in socials]
     
-    platforms = ['facebook', 'instagram', 'linkedin', 'twitter', 'youtube']
     merged = {}
     
-    # Merge individual platforms (prefer non-null)
-    for platform in platforms:
-        merged[platform] = social1.get(platform) or social2.get(platform) or None
+    # Merge individual platforms (prefer the first non-null)
+    for platform in SOCIAL_PLATFORMS:
+        merged[platform] = next(filter(None, (social.get(platform) for social in socials)), None)
     
     # Merge 'other' arrays
-    other1 = social1.get('other') or []
-    other2 = social2.get('other') or []
-    merged['other'] = merge_lists(other1, other2)
+    merged['other'] = merge_lists(*(social.get('other') for social in socials))
     
     return merged
 
@@ -174,16 +184,24 @@ def has_content(value):
     Returns:
         True if value has content, False otherwise
     """
-    if value is None:
-        return False
+    # Iterative walk over nested lists/dicts: no recursive call or generator
+    # frame per level, and it returns on the first non-empty leaf
+    stack = [value]
     
-    if isinstance(value, str):
-        return bool(value.strip())
-    
-    if isinstance(value, list):
-        return any(has_content(item) for item in value)
-    
-    if isinstance(value, dict):
-        return any(has_content(v) for v in value.values())
-    
-    return bool(value)
+    while stack:
+        item = stack.pop()
+        
+        if item is None:
+            continue
+        
+        if isinstance(item, str):
+            if item.strip():
+                return True
+        elif isinstance(item, list):
+            stack.extend(item)
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif item:
+            return True
+    
+    return False
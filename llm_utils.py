@@ -1,18 +1,12 @@
 import google.genai as genai
+from google.genai import types
 from dotenv import load_dotenv
+from functools import lru_cache
 import os
 
+# Loaded at import because the app reads its other settings (S3, cache) from the same .env
 load_dotenv()
 
-api_key = os.getenv("GEMINI_API_KEY")
-
-if not api_key:
-
-    raise ValueError("GEMINI_API_KEY is not set. Please check your .env file or environment variables.")
-
-
-client = genai.Client(api_key=api_key)
-
 MODEL_NAME = 'gemini-2.5-flash'
 
 class ModelWrapper:
@@ -26,5 +20,18 @@ class ModelWrapper:
             contents=contents
         )
 
+@lru_cache(maxsize=1)
+def get_client():
+    # Created on first use, so importing this module does not require GEMINI_API_KEY
+    api_key = os.getenv("GEMINI_API_KEY")
+    if not api_key:
+        raise ValueError("GEMINI_API_KEY is not set. Please check your .env file or environment variables.")
+
+    return genai.Client(api_key=api_key)
+
+@lru_cache(maxsize=1)
 def get_model():
-    return ModelWrapper(client, MODEL_NAME)
+    return ModelWrapper(get_client(), MODEL_NAME)
+
+def image_part(data, mime_type='image/jpeg'):
+    return types.Part.from_bytes(data=data, mime_type=mime_type)
@@ -1,5 +1,57 @@
 from info_utils import normalize_field, merge_lists, merge_social_media
 
+def _merge_names(values):
+    """Merge name fields from all cards into one deduplicated list, or None if empty."""
+    return merge_lists(*(normalize_field(value, return_type='list') for value in values))
+
+def _first_value(values):
+    """Return the first non-null value, or None."""
+    return next(filter(None, values), None)
+
+def _first_string(values):
+    """Return the first value that normalizes to a non-empty string, or None."""
+    return next(filter(None, (normalize_field(value, return_type='string') for value in values)), None)
+
+def _merge_array(values):
+    """Merge list fields from all cards into one deduplicated list, or None if empty."""
+    return merge_lists(*values)
+
+def _merge_social(values):
+    """Merge social media profiles from all cards, preferring earlier cards per platform."""
+    return merge_social_media(*values)
+
+# How each field is merged, in output order. New fields only need an entry here.
+MERGE_SCHEMA = (
+    ('company_name', _merge_names),
+    ('person_name', _merge_names),
+    ('address', _first_value),              # prefer the first non-null
+    ('category', _first_string),            # single string
+    ('contact_numbers', _merge_array),      # merge and deduplicate
+    ('email_addresses', _merge_array),
+    ('services', _merge_array),
+    ('website', _merge_array),
+    ('social_media_profiles', _merge_social),
+)
+
+def merge_many(cards):
+    """
+    Merge extracted information from any number of images.
+    
+    Each field is merged in a single pass over all cards, so merging N cards
+    costs one deduplication per field instead of N-1 pairwise merges.
+    
+    Args:
+        cards: Iterable of extracted data dicts, in priority order
+    
+    Returns:
+        Merged extracted data dict
+    """
+    cards = list(cards)
+    return {
+        field: merge(card.get(field) for card in cards)
+        for field, merge in MERGE_SCHEMA
+    }
+
 def merge_extracted_data(img_data_image1, img_data_image2):
     """
     Merge extracted information from two images.
@@ -11,43 +63,4 @@ def merge_extracted_data(img_data_image1, img_data_image2):
     Returns:
         Merged extracted data dict
     """
-    merged = {}
-    
-    # MERGE COMPANY NAMES
-    company1 = normalize_field(img_data_image1.get('company_name'), return_type='list')
-    company2 = normalize_field(img_data_image2.get('company_name'), return_type='list')
-    merged['company_name'] = merge_lists(company1, company2)
-    
-    # MERGE PERSON NAMES
-    person1 = normalize_field(img_data_image1.get('person_name'), return_type='list')
-    person2 = normalize_field(img_data_image2.get('person_name'), return_type='list')
-    merged['person_name'] = merge_lists(person1, person2)
-    
-    # SIMPLE FIELDS (prefer non-null)
-    merged['address'] = (
-        img_data_image1.get('address') or 
-        img_data_image2.get('address') or 
-        None
-    )
-    
-    # CATEGORY (single string)
-    merged['category'] = (
-        normalize_field(img_data_image1.get('category'), return_type='string') or
-        normalize_field(img_data_image2.get('category'), return_type='string') or
-        None
-    )
-    
-    # ARRAY FIELDS (merge and deduplicate)
-    array_fields = ['contact_numbers', 'email_addresses', 'services', 'website']
-    
-    for field in array_fields:
-        data1 = img_data_image1.get(field)
-        data2 = img_data_image2.get(field)
-        merged[field] = merge_lists(data1, data2)
-    
-    # SOCIAL MEDIA PROFILES
-    social1 = img_data_image1.get('social_media_profiles', {}) or {}
-    social2 = img_data_image2.get('social_media_profiles', {}) or {}
-    merged['social_media_profiles'] = merge_social_media(social1, social2)
-    
-    return merged
+    return merge_many((img_data_image1, img_data_image2))
@@ -1,52 +1,15 @@
-prompt = """You are an OCR data extraction engine for business visiting cards.
+from functools import lru_cache
+from pathlib import Path
 
-Extract information ONLY from the provided visiting card image(s) and return ONLY a valid JSON object.
-DO NOT return explanations, markdown, or extra text.
+# Prompt texts live in prompts/*.txt and are read once per process
+PROMPTS_DIR = Path(__file__).parent / 'prompts'
 
-STRICT RULES (MANDATORY):
-1. Extract ONLY information that is clearly visible and explicitly written in the image or decoded from QR codes.
-2. DO NOT guess, infer, assume, or fabricate any data.
-3. DO NOT extract information from logos, icons, or images unless readable text is present.
-4. If text is missing, unclear, or unreadable, return null.
-5. If the image is NOT a visiting card (logo only, app icon, random image), return null for ALL fields.
-6. Scan and decode ALL QR codes. Extract URLs found in QR codes.
-7. Extract phone numbers, emails, websites, and social media URLs ONLY if explicitly written or decoded from QR codes.
-8. NEVER create services, contact details, websites, emails, or social profiles.
-9. Output MUST be valid JSON only.
-
-OUTPUT JSON STRUCTURE (EXACT):
-{
-  "company_name": ["Company Name\\nQuote or Subtitle1", "Company Name\\nQuote or Subtitle2"] or "Company Name\\nQuote or Subtitle1" or "Company Name\\nQuote or Subtitle2" or null,
-  "person_name": ["Person Name 1(position if mentioned)", "Person Name 2(position if mentioned)"] or "Person Name" or null,
-  "contact_numbers": ["number1", "number2"] or null,
-  "social_media_profiles": {
-    "facebook": "URL or null",
-    "instagram": "URL or null",
-    "linkedin": "URL or null",
-    "twitter": "URL or null",
-    "youtube": "URL or null",
-    "other": ["URL1", "URL2"] or null
-  },
-  "address": "full address or null",
-  "services": ["service1", "service2"] or null,
-  "website": ["URL1", "URL2"] or "URL" or null,
-  "email_addresses": ["email1", "email2"] or null,
-  "category": "ONE primary business category string or null"
-}
-
-EXTRACTION RULES:
-- company_name: Extract ONLY company names explicitly. Combine company name and its quote/tagline/subtitle using \\n. If there are multiple company names, return them as an array.
-- contact_numbers, email_addresses, website, person_name, services: Extract ONLY contact numbers, email addresses, websites, person names, and services explicitly written as text. If there are multiple contact numbers or email addresses, return them as an array.
-- person_name: If position is mentioned, include it in the person name.
-- category: Return ONLY ONE category if clearly determinable from written content; otherwise null.
-- QR code URLs:
-  • Website URLs → website
-  • Facebook / Instagram / LinkedIn / Twitter / YouTube URLs → respective fields
-  • Any other platform URLs → social_media_profiles.other
-
-FINAL REQUIREMENT:
-Return ONLY the JSON object. If any field is not available, use null.
-"""
+@lru_cache(maxsize=None)
+def load_prompt(name):
+    return (PROMPTS_DIR / f'{name}.txt').read_text(encoding='utf-8')
 
 def get_prompt():
-    return prompt
\ No newline at end of file
+    return load_prompt('card_extract')
+
+def get_pair_instruction():
+    return load_prompt('card_pair')